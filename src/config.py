@@ -80,6 +80,10 @@ class PipelineConfig:
     enable_oversampling: bool = True
     oversampling_method: str = "smote"  # Options: "random", "smote", "adasyn", "none"
     oversampling_strategy: str = "minority"  # or "all", or float for specific ratio
+    smote_nc: bool = False  # With sparse_output, run SMOTE-NC so indicator columns stay 0/1 (~20x slower than SMOTE)
+    
+    # Feature Encoding
+    sparse_output: bool = False  # Return X as a CSR matrix (requires scaler_type "none" or enable_scaling False)
     
     # Feature Scaling
     enable_scaling: bool = True
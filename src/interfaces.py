@@ -123,6 +123,9 @@ class IVisualizer(ABC):
 class ISamplingStrategy(ABC):
     """Interface for sampling strategies (Strategy Pattern)."""
     
+    # Lets concrete strategies declare __slots__ and skip a per-instance __dict__
+    __slots__ = ()
+    
     @abstractmethod
     def resample(self, X, y) -> Tuple:
         """Resample the dataset to handle class imbalance.
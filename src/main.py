@@ -34,7 +34,7 @@ def main():
         config = AppConfig()
 
         # 2. Dependencies
-        loader = CSVLoader(config.data_path)
+        loader = CSVLoader(config.data_path, config.features)
         preprocessor = Preprocessor(config)
         
         # 3. Visualizer (optional)
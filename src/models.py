@@ -1,6 +1,4 @@
-from sklearn.metrics import accuracy_score, precision_score, recall_score, f1_score, roc_auc_score, confusion_matrix
-import matplotlib.pyplot as plt
-import seaborn as sns
+from sklearn.metrics import roc_auc_score, confusion_matrix
 from .interfaces import IModel
 
 class SklearnModelAdapter(IModel):
@@ -36,8 +34,13 @@ class ModelEvaluator:
             dict of metrics (Accuracy, Precision, Recall, F1_Score, ROC_AUC, FNR, Model)
         """
         try:
+            # Every threshold metric derives from the four confusion-matrix counts,
+            # so the label arrays are only scanned once (plus once more for ROC AUC)
             cm = confusion_matrix(y_true, y_pred)
             TN, FP, FN, TP = cm.ravel()
+            total = TN + FP + FN + TP
+            precision = TP / (TP + FP) if (TP + FP) > 0 else 0.0
+            recall = TP / (TP + FN) if (TP + FN) > 0 else 0.0
 
             # Compute ROC AUC robustly: prefer y_score (probabilities/scores), fallback to y_pred
             try:
@@ -51,10 +54,10 @@ class ModelEvaluator:
 
             return {
                 "Model": model_name,
-                "Accuracy": accuracy_score(y_true, y_pred),
-                "Precision": precision_score(y_true, y_pred, zero_division=0),
-                "Recall": recall_score(y_true, y_pred),
-                "F1_Score": f1_score(y_true, y_pred),
+                "Accuracy": (TN + TP) / total,
+                "Precision": precision,
+                "Recall": recall,
+                "F1_Score": 2 * precision * recall / (precision + recall) if (precision + recall) > 0 else 0.0,
                 "ROC_AUC": roc_auc,
                 "FNR": FN / (FN + TP) if (FN + TP) > 0 else 0
             }
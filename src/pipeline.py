@@ -1,14 +1,72 @@
 import pandas as pd
+from scipy import sparse
 from sklearn.model_selection import train_test_split
 # from imblearn.over_sampling import RandomOverSampler
 # from sklearn.preprocessing import StandardScaler
 from .config import AppConfig
 from .interfaces import IDataLoader, IPreprocessor, IVisualizer
-from .models import ModelEvaluator
+from .models import ModelEvaluator, SklearnModelAdapter
+from .preprocessor import Preprocessor
 from typing import Optional
 from .sampling_strategy import SamplingStrategyFactory
 from .scaler_factory import ScalerFactory
 
+PIPELINE_CACHE_DIR = ".cache/pipeline"
+
+
+def build_pipeline(app_config: AppConfig, sampler_name: str, scaler_name: str, estimator,
+                   cache_dir: Optional[str] = PIPELINE_CACHE_DIR):
+    """
+    Compose preprocessing, resampling, scaling and a model into one imblearn Pipeline.
+
+    The preprocessor and sampler outputs are cached with ``joblib.Memory`` under
+    ``cache_dir`` (and nowhere else), so
+    refitting with different model hyperparameters (e.g. inside a grid search)
+    reuses them. Scaling and the model sit in a nested, uncached pipeline as the
+    final step: hashing the scaler's input would cost about as much as scaling it.
+
+    Args:
+        app_config: Application configuration
+        sampler_name: Sampling method name (see ``SamplingStrategyFactory``)
+        scaler_name: Scaler type (see ``ScalerFactory``)
+        estimator: sklearn-compatible classifier or ``SklearnModelAdapter``
+        cache_dir: Directory for cached step outputs, or None to disable caching
+
+    Returns:
+        imblearn Pipeline taking the raw DataFrame as X and the target as y.
+        Steps are ``pre``, ``sampler`` and ``model`` (itself ``scaler`` + ``clf``).
+    """
+    from imblearn import FunctionSampler
+    from imblearn.pipeline import Pipeline as ImbPipeline
+    from joblib import Memory
+    from sklearn.pipeline import Pipeline
+
+    # "none" selections become "passthrough" steps, which the pipeline skips outright
+    strategy = SamplingStrategyFactory.create_strategy(
+        method=sampler_name,
+        sampling_strategy=app_config.pipeline.oversampling_strategy,
+        random_state=app_config.random_state,
+        passthrough=True
+    )
+    # cache_dir alone decides caching: the pipeline memory already caches the
+    # sampler step, so the strategy's own SAMPLING_CACHE_DIR cache is bypassed
+    if hasattr(strategy, "use_cache"):
+        strategy.use_cache = False
+    sampler = strategy if strategy == "passthrough" else FunctionSampler(func=strategy.resample, validate=False)
+    scaler = ScalerFactory.create_scaler(scaler_name, passthrough=True)
+
+    if isinstance(estimator, SklearnModelAdapter):
+        estimator = estimator.model
+
+    memory = Memory(location=cache_dir, compress=1, verbose=0) if cache_dir else None
+
+    return ImbPipeline(steps=[
+        ("pre", Preprocessor(app_config)),
+        ("sampler", sampler),
+        ("model", Pipeline(steps=[("scaler", scaler), ("clf", estimator)])),
+    ], memory=memory)
+
+
 class PipelineOrchestrator:
     def __init__(self, config: AppConfig, loader: IDataLoader, 
                  preprocessor: IPreprocessor, visualizer: Optional[IVisualizer] = None):
@@ -55,13 +113,28 @@ class PipelineOrchestrator:
             
         Returns:
             DataFrame with model performance metrics
+
+        Raises:
+            ValueError: if ``sparse_output`` is combined with a scaler that cannot
+                        take sparse input.
         """
+        pipeline_config = self.config.pipeline
+        if (pipeline_config.sparse_output and pipeline_config.enable_scaling
+                and pipeline_config.scaler_type.lower() != "none"):
+            raise ValueError(
+                f"sparse_output=True cannot be combined with scaler_type="
+                f"'{pipeline_config.scaler_type}': centering or range scaling would densify "
+                f"the sparse feature matrix. Use scaler_type='none' or enable_scaling=False."
+            )
+
         print("1. Loading Data...")
         raw_df = self.loader.load()
         
         print("2. Preprocessing...")
         X, y = self.preprocessor.process(raw_df)
-        self._feature_names = X.columns.tolist()
+        self._feature_names = (
+            X.columns.tolist() if hasattr(X, "columns") else self.preprocessor.get_feature_names_out().tolist()
+        )
 
         print("3. Splitting Data...")
         X_train, X_test, y_train, y_test = train_test_split(
@@ -80,10 +153,19 @@ class PipelineOrchestrator:
         if self.config.pipeline.enable_oversampling:
             print(f"4. Handling Imbalance (Training Set Only) using '{self.config.pipeline.oversampling_method}'...")
             
+            # Opt-in SMOTE-NC keeps sparse indicator columns binary, at a large runtime cost
+            strategy_params = {}
+            cat_features = getattr(self.preprocessor, "categorical_feature_indices_", None)
+            if (self.config.pipeline.smote_nc
+                    and self.config.pipeline.oversampling_method.lower() == "smote"
+                    and sparse.issparse(X_train) and cat_features is not None):
+                strategy_params["categorical_features"] = cat_features
+
             sampling_strategy = SamplingStrategyFactory.create_strategy(
                 method=self.config.pipeline.oversampling_method,
                 sampling_strategy=self.config.pipeline.oversampling_strategy,
-                random_state=self.config.random_state
+                random_state=self.config.random_state,
+                **strategy_params
             )
             
             X_train_res, y_train_res = sampling_strategy.resample(X_train, y_train)
@@ -1,77 +1,418 @@
+from dataclasses import dataclass
 import pandas as pd
 import numpy as np
-from sklearn.preprocessing import OrdinalEncoder
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.utils.validation import check_is_fitted
 from .interfaces import IPreprocessor
-from typing import Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from .config import AppConfig
 
-class Preprocessor(IPreprocessor):
+
+def _as_str(series: pd.Series) -> pd.Series:
+    """Convert values to strings; categoricals only convert their category pool."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.rename_categories(series.cat.categories.astype(str))
+    return series.astype(str)
+
+
+def _category_codes(series: pd.Series, categories: pd.Index, as_str: bool = False) -> np.ndarray:
+    """
+    Return the position of each value in ``categories`` (-1 for missing/unknown).
+
+    ``categories`` is built once at fit time, so its hash table is reused across
+    calls. Plain columns are factorized first, so the lookup (and the optional
+    str conversion) runs once per distinct value instead of once per row;
+    categorical columns are recoded through their category pool, or used as-is
+    when already typed with ``categories`` (see ``Preprocessor.categorical_dtypes_``).
+    """
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        if series.cat.categories.equals(categories):
+            return series.cat.codes.to_numpy()
+        if as_str:
+            series = _as_str(series)
+        return pd.Categorical(series, categories=categories).codes
+    inverse, uniques = pd.factorize(series)
+    if as_str:
+        uniques = uniques.astype(str)
+    # Trailing -1 maps factorize's missing-value code (-1) to -1
+    return np.append(categories.get_indexer(uniques), -1)[inverse]
+
+
+def _observed_categories(series: pd.Series) -> np.ndarray:
+    """Return the sorted distinct non-missing values of a column."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        values = series.cat.remove_unused_categories().cat.categories.to_numpy()
+    else:
+        values = pd.unique(series.dropna().to_numpy())
+    return np.sort(values)
+
+
+@dataclass(frozen=True)
+class _ColumnPlan:
+    """Column work of one ``transform`` call, resolved against the input columns."""
+    bool_cols: List[str]
+    bool_idx: List[int]
+    float_cols: List[str]
+    ord_cols: List[str]
+    passthrough_cols: List[str]
+    missing_idx: List[int]
+    one_hot_items: List[Tuple[str, int]]
+
+
+class Preprocessor(TransformerMixin, BaseEstimator, IPreprocessor):
     """
     Preprocessor that uses FeatureConfig for column treatment.
-    
+
+    Follows the sklearn transformer contract: ``fit`` learns the column layout
+    and encoder categories, ``transform`` only applies them, so the same
+    instance can encode train and test data consistently or sit as the first
+    step of a (cached) sklearn ``Pipeline``.
+
     Args:
-        feature_config: Configuration defining which columns get which preprocessing
+        app_config: Application configuration (features, target column, pipeline options)
     """
-    
+
     def __init__(self, app_config: AppConfig) -> None:
-        self.feature_config = app_config.features
+        # Only the constructor parameter is stored here (sklearn convention), so
+        # set_params/clone work; all fitted state is created by fit/partial_fit
         self.app_config = app_config
 
-    def process(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
+    def __sklearn_is_fitted__(self) -> bool:
+        """Report the fitted state to ``sklearn.utils.validation.check_is_fitted``."""
+        return getattr(self, "_is_fitted", False)
+
+    def get_feature_names_out(self, input_features=None) -> np.ndarray:
+        """Return the column names of the feature matrix produced by ``transform``."""
+        check_is_fitted(self)
+        return np.asarray(self._feature_names, dtype=object)
+
+    def fit(self, df: pd.DataFrame, y=None) -> "Preprocessor":
         """
-        Convert raw dataframe into model-ready feature matrix X and target y.
+        Learn the column layout and the category universe of each categorical column.
 
-        Behavior:
-        - Drops identifier columns if present.
-        - Converts Yes/No columns to booleans (missing -> False).
-        - Converts numeric columns to numeric dtype (coercing errors to NaN).
-        - Ordinal-encodes columns from config.
-        - One-hot encodes categorical columns.
-        - Ensures the target column exists and returns (X, y).
+        Args:
+            df: Raw input pandas DataFrame (the target column is ignored if present)
+            y: Ignored, present for sklearn compatibility
+
+        Returns:
+            self
+        """
+        self._is_fitted = False
+        return self._partial_fit(df, update_stats=False)
+
+    def partial_fit(self, df: pd.DataFrame, y=None) -> "Preprocessor":
+        """
+        Update the fitted state with one chunk of data, for out-of-core training.
+
+        The first call fixes the column layout; every call unions the observed
+        categories into the category universe and folds the chunk into running
+        float column statistics (``float_mean_``/``float_var_``, which plain ``fit``
+        skips). Call it on every chunk before transforming any, since new
+        categories add one-hot columns.
+
+        Example:
+            for chunk in loader.iter_chunks():
+                preprocessor.partial_fit(chunk)
+            for X_block, y_block in preprocessor.transform_chunks(loader.iter_chunks()):
+                clf.partial_fit(X_block, y_block, classes=[0, 1])
 
         Args:
-            df: Raw input pandas DataFrame
+            df: Chunk of the raw input DataFrame
+            y: Ignored, present for sklearn compatibility
 
         Returns:
-            Tuple of (X: pd.DataFrame, y: pd.Series[int])
+            self
+        """
+        return self._partial_fit(df, update_stats=True)
+
+    def _partial_fit(self, df: pd.DataFrame, update_stats: bool) -> "Preprocessor":
+        """Shared body of ``fit``/``partial_fit``; ``update_stats`` also folds in float statistics."""
+        if not self.__sklearn_is_fitted__():
+            self._fit_layout(df)
+
+        # Sorted observed categories per column, scanned at fit time and reused by
+        # every transform; the first category is dropped from the one-hot block
+        cat_names = []
+        for col in self._cat_cols:
+            categories = _observed_categories(df[col])
+            if col in self._cat_universe:
+                categories = np.union1d(self._cat_universe[col].to_numpy(), categories)
+            self._cat_universe[col] = pd.Index(categories)
+            cat_names.extend(f"{col}_{cat}" for cat in categories[1:])
+        self._feature_names = self._feature_columns + cat_names
+        # One-hot offsets depend on the universe, so the plan is rebuilt per chunk
+        self._plan = self._build_plan(self._required_columns)
+
+        if update_stats:
+            self._update_float_stats(df)
+        self._is_fitted = True
+        return self
+
+    def _fit_layout(self, df: pd.DataFrame) -> None:
+        """
+        Resolve which configured columns are present and reset the fitted state.
 
         Raises:
-            ValueError: if required target column is missing.
+            ValueError: if an unconfigured column is not numeric, since it cannot
+                        pass through into the float32 feature matrix.
         """
-        data = df.copy()
+        fc = self.app_config.features
+        excluded = set(fc.id_columns) | {self.app_config.target_column}
+        columns = [c for c in df.columns if c not in excluded]
+
+        self._bool_cols = [c for c in fc.boolean_columns if c in columns]
+        self._float_cols = [c for c in fc.float_columns if c in columns]
+        self._ord_cols = [c for c in fc.ordinal_columns if c in columns]
+        self._cat_cols = [c for c in fc.categorical_columns if c in columns]
+        self._ord_index = {c: pd.Index(fc.ordinal_columns[c]) for c in self._ord_cols}
+        self._cat_universe = {}
+
+        # Non one-hot columns keep their original order, one-hot columns follow
+        cat_set = set(self._cat_cols)
+        self._feature_columns = [c for c in columns if c not in cat_set]
+        self._col_index = {c: i for i, c in enumerate(self._feature_columns)}
+
+        typed = set(self._bool_cols) | set(self._float_cols) | set(self._ord_cols)
+        self._passthrough_cols = [c for c in self._feature_columns if c not in typed]
+        non_numeric = [c for c in self._passthrough_cols if not pd.api.types.is_numeric_dtype(df[c])]
+        if non_numeric:
+            raise ValueError(
+                f"Columns {non_numeric} are not configured in FeatureConfig and are not numeric; "
+                f"add them to a FeatureConfig column list (or to id_columns to drop them)."
+            )
+        self._required_columns = frozenset(self._feature_columns) | cat_set
+
+        self._float_count = np.zeros(len(self._float_cols))
+        self._float_mean = np.zeros(len(self._float_cols))
+        self._float_m2 = np.zeros(len(self._float_cols))
 
-        # 1. Drop identifiers
-        data.drop(columns = self.feature_config.id_columns, errors='ignore', inplace=True)
+    def _update_float_stats(self, df: pd.DataFrame) -> None:
+        """Merge a chunk's float column moments into the running totals (Chan/Welford)."""
+        if not self._float_cols:
+            return
+        values = pd.DataFrame(
+            {c: pd.to_numeric(df[c], errors='coerce') for c in self._float_cols}, index=df.index
+        ).astype(np.float64)
+        n_b = values.count().to_numpy(dtype=np.float64)
+        mean_b = np.nan_to_num(values.mean().to_numpy())
+        m2_b = np.nan_to_num(values.var(ddof=0).to_numpy()) * n_b
 
-        # 2. Boolean Conversion
-        for col in self.feature_config.boolean_columns:
-            if col in data.columns:
-                data[col] = data[col].map({'Yes': True, 'No': False}).fillna(False)
+        n_a = self._float_count
+        n = n_a + n_b
+        with np.errstate(invalid='ignore', divide='ignore'):
+            delta = mean_b - self._float_mean
+            self._float_mean = np.where(n > 0, self._float_mean + delta * n_b / n, 0.0)
+            self._float_m2 = np.where(n > 0, self._float_m2 + m2_b + delta ** 2 * n_a * n_b / n, 0.0)
+        self._float_count = n
+
+    def _build_plan(self, columns) -> _ColumnPlan:
+        """
+        Resolve the fitted layout against a set of input columns.
+
+        The plan for the fitted columns is built once per ``partial_fit`` and reused
+        by every ``transform`` on complete input, so the membership checks and list
+        building below only run again for frames missing some fitted columns.
+
+        Args:
+            columns: Column labels available in the frame to transform
+
+        Returns:
+            _ColumnPlan with the present columns per conversion and their output positions
+        """
+        bool_cols = [c for c in self._bool_cols if c in columns]
+        offsets, offset = [], 0
+        for col in self._cat_cols:
+            offsets.append(offset)
+            offset += max(len(self._cat_universe.get(col, ())) - 1, 0)
+        return _ColumnPlan(
+            bool_cols=bool_cols,
+            bool_idx=[self._col_index[c] for c in bool_cols],
+            float_cols=[c for c in self._float_cols if c in columns],
+            ord_cols=[c for c in self._ord_cols if c in columns],
+            passthrough_cols=[c for c in self._passthrough_cols if c in columns],
+            missing_idx=[self._col_index[c] for c in self._feature_columns if c not in columns],
+            one_hot_items=[(c, o) for c, o in zip(self._cat_cols, offsets) if c in columns],
+        )
+
+    @property
+    def categorical_feature_indices_(self) -> np.ndarray:
+        """Output column indices of the boolean and one-hot (indicator) features."""
+        bool_idx = [self._col_index[c] for c in self._bool_cols]
+        cat_idx = range(len(self._feature_columns), len(self._feature_names))
+        return np.array(sorted(bool_idx) + list(cat_idx), dtype=np.intp)
+
+    @property
+    def categorical_dtypes_(self) -> Dict[str, pd.CategoricalDtype]:
+        """
+        Fitted category universe of each one-hot column as a ``CategoricalDtype``.
+
+        Casting the categorical block with these dtypes in one ``astype`` call, or
+        merging them into the ``dtype`` map passed to ``CSVLoader.load``, makes
+        ``transform`` take the category codes directly instead of hashing every
+        value again.
+        """
+        return {col: pd.CategoricalDtype(self._cat_universe[col]) for col in self._cat_cols}
 
-        # 3. Float Conversion 
-        # Coerce to numeric and ensure float dtype for consistency
-        for col in self.feature_config.float_columns:
-            if col in data.columns:
-                data[col] = pd.to_numeric(data[col], errors='coerce').astype(float)
+    @property
+    def float_mean_(self) -> pd.Series:
+        """Running mean of each float column over the chunks seen by ``partial_fit`` (NaN after ``fit``)."""
+        return pd.Series(np.where(self._float_count > 0, self._float_mean, np.nan), index=self._float_cols)
 
-        # 4. Ordinal Encoding
-        for col, categories in self.feature_config.ordinal_columns.items():
-            if col in data.columns:
-                data[col] = data[col].astype(str)
-                enc = OrdinalEncoder(categories=[categories], handle_unknown='use_encoded_value', unknown_value=-1)
-                data[col] = enc.fit_transform(data[[col]])
-                data.drop(columns=["ncap_rating"], inplace=True)
+    @property
+    def float_var_(self) -> pd.Series:
+        """Running population variance of each float column (see ``float_mean_``)."""
+        with np.errstate(invalid='ignore', divide='ignore'):
+            return pd.Series(np.where(self._float_count > 0, self._float_m2 / self._float_count, np.nan),
+                             index=self._float_cols)
+
+    def transform(self, df: pd.DataFrame) -> Union[pd.DataFrame, sparse.csr_matrix]:
+        """
+        Encode a raw dataframe using the layout learned in ``fit``.
+
+        Columns seen during ``fit`` but missing here are filled with 0 and
+        unseen categories encode to all-zero one-hot rows, so the output
+        shape is stable across splits.
+
+        Args:
+            df: Raw input pandas DataFrame (the target column is dropped if present)
+
+        Returns:
+            Feature matrix X as a float32 pd.DataFrame, or a float32 CSR matrix
+            when ``PipelineConfig.sparse_output`` is enabled
+
+        Raises:
+            NotFittedError: if called before ``fit``.
+        """
+        check_is_fitted(self)
+
+        # All features are written into one Fortran-ordered float32 buffer: each
+        # column write is a contiguous pass and wrapping it in a DataFrame is zero-copy.
+        # ``df`` itself is never copied or mutated.
+        sparse_output = self.app_config.pipeline.sparse_output
+        plan = self._plan if self._required_columns.issubset(df.columns) else self._build_plan(df.columns)
+        n_rows = len(df)
+        n_num = len(self._feature_columns)
+        n_out = n_num if sparse_output else len(self._feature_names)
+        X = np.empty((n_rows, n_out), dtype=np.float32, order='F')
+        col_index = self._col_index
+
+        # 1. Boolean Conversion
+        # Single vectorized comparison over the whole block; NaN != 'Yes' so missing -> 0
+        if plan.bool_cols:
+            X[:, plan.bool_idx] = np.equal(df[plan.bool_cols].to_numpy(dtype=object), 'Yes')
+
+        # 2. Numeric Conversion
+        # Coerce to numeric; float32 halves the bytes moved by scalers, samplers and models
+        for col in plan.float_cols:
+            X[:, col_index[col]] = pd.to_numeric(df[col], errors='coerce').to_numpy()
+
+        # 3. Ordinal Encoding
+        # Categories are fixed by config, so no encoder needs fitting; unknown values -> -1
+        for col in plan.ord_cols:
+            X[:, col_index[col]] = _category_codes(df[col], self._ord_index[col], as_str=True)
+
+        # 4. Remaining numeric columns pass through
+        for col in plan.passthrough_cols:
+            X[:, col_index[col]] = df[col].to_numpy()
+
+        # Columns missing from df are filled with 0
+        if plan.missing_idx:
+            X[:, plan.missing_idx] = 0
 
         # 5. One-Hot Encoding
-        if self.feature_config.categorical_columns:
-            data = pd.get_dummies(data, columns=[c for c in self.feature_config.categorical_columns if c in data.columns], drop_first=True)
+        rows, cols = self._one_hot_indices(df, plan.one_hot_items)
+
+        if sparse_output:
+            n_cat = len(self._feature_names) - n_num
+            X_cat = sparse.csr_matrix(
+                (np.ones(len(rows), dtype=np.float32), (rows, cols)), shape=(n_rows, n_cat)
+            )
+            return sparse.hstack([sparse.csr_matrix(X), X_cat], format='csr')
+
+        X[:, n_num:] = 0
+        X[rows, n_num + cols] = 1
+        # A shallow index copy: sharing df.index with y would change joblib's hash of
+        # (X, y) once X is reloaded from a Pipeline cache, missing the sampler cache
+        return pd.DataFrame(X, index=df.index.copy(), columns=self._feature_names, copy=False)
+
+    def _one_hot_indices(self, df: pd.DataFrame, items: List[Tuple[str, int]]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Locate the non-zero entries of the one-hot block for ``df``.
+
+        Values are coded against the cached category universe; the dropped first
+        category, unseen categories and missing values produce no entry.
+
+        Args:
+            df: Frame to encode
+            items: (column, offset in the one-hot block) pairs, from ``_ColumnPlan``
+
+        Returns:
+            Tuple of (row indices, column indices relative to the one-hot block)
+        """
+        all_rows, all_cols = [], []
+        for col, offset in items:
+            codes = _category_codes(df[col], self._cat_universe[col])
+            rows = np.flatnonzero(codes > 0)
+            all_rows.append(rows)
+            all_cols.append(offset + codes[rows].astype(np.intp) - 1)
+
+        if not all_rows:
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp)
+        return np.concatenate(all_rows), np.concatenate(all_cols)
 
-        # 6. Separate Target Variable
+    def transform_chunks(self, chunks: Iterable[pd.DataFrame]) -> Iterator[Tuple[Union[pd.DataFrame, sparse.csr_matrix], Optional[pd.Series]]]:
+        """
+        Lazily transform a stream of raw chunks (e.g. ``CSVLoader.iter_chunks``).
+
+        Only one chunk is held in memory at a time, so models with incremental
+        training (``SGDClassifier.partial_fit``, ...) can train on data larger
+        than RAM.
+
+        Args:
+            chunks: Iterable of raw DataFrame chunks
+
+        Yields:
+            Tuple of (X_block, y_block); y_block is None if the chunk has no target column
+        """
+        target_col = self.app_config.target_column
+        for chunk in chunks:
+            y = chunk[target_col].astype(np.int8) if target_col in chunk.columns else None
+            yield self.transform(chunk), y
+
+    def process(self, df: pd.DataFrame) -> Tuple[Union[pd.DataFrame, sparse.csr_matrix], pd.Series]:
+        """
+        Convert raw dataframe into model-ready feature matrix X and target y.
+
+        Equivalent to ``fit_transform`` on the features plus target extraction.
+
+        Behavior:
+        - Drops identifier columns if present.
+        - Converts Yes/No columns to 1.0/0.0 (missing -> 0.0).
+        - Converts numeric columns to float32 (coercing errors to NaN).
+        - Ordinal-encodes columns from config (unknown values -> -1).
+        - One-hot encodes categorical columns (sparse, first category dropped).
+        - Passes other numeric columns through as float32 (float64 is narrowed);
+          unconfigured non-numeric columns raise ValueError.
+        - Ensures the target column exists and returns (X, y).
+
+        When ``PipelineConfig.sparse_output`` is enabled, X is returned as a
+        float32 CSR matrix; use ``get_feature_names_out`` for its column names.
+
+        Args:
+            df: Raw input pandas DataFrame
+
+        Returns:
+            Tuple of (X: pd.DataFrame or sparse.csr_matrix, y: pd.Series[int8])
+
+        Raises:
+            ValueError: if required target column is missing.
+        """
         target_col = self.app_config.target_column
-        if target_col not in data.columns:
+        if target_col not in df.columns:
             raise ValueError(f"Target column '{target_col}' missing from dataset")
-            
-        X = data.drop(columns=[target_col])
-        y = data[target_col].astype(int)
+
+        X = self.fit_transform(df)
+        y = df[target_col].astype(np.int8)
 
         return X, y
@@ -5,15 +5,54 @@ This module implements the Strategy Pattern for different resampling approaches.
 Each strategy encapsulates a specific algorithm for balancing training data.
 """
 
-from typing import Tuple
+from typing import Optional, Sequence, Tuple
 import pandas as pd
-from imblearn.over_sampling import RandomOverSampler, SMOTE, ADASYN
+from joblib import Memory
+from scipy import sparse
 from .interfaces import ISamplingStrategy
 
+# imblearn (and the sklearn/scipy stack behind it) is imported inside each
+# strategy's ``resample`` so that selecting "none" never pays for loading it.
+
+# On-disk cache for the k-NN based samplers. Results are keyed on a hash of the
+# input data and sampler parameters, so repeated runs on identical training data
+# (e.g. sweeping downstream model hyperparameters) load instead of refitting.
+SAMPLING_CACHE_DIR = ".cache/sampling"
+_memory: Optional[Memory] = None  # created on first cached call, so importing writes nothing
+
+_CACHEABLE_SAMPLERS = ("SMOTE", "SMOTENC", "ADASYN")
+
+
+def _fit_resample(sampler_name: str, X, y, sampling_strategy, random_state: int, **params) -> Tuple:
+    """Run ``fit_resample`` for a cacheable sampler."""
+    from imblearn import over_sampling
+
+    if sampler_name not in _CACHEABLE_SAMPLERS:
+        raise ValueError(f"Sampler '{sampler_name}' is not cacheable")
+    sampler = getattr(over_sampling, sampler_name)(
+        sampling_strategy=sampling_strategy,
+        random_state=random_state,
+        **params
+    )
+    return sampler.fit_resample(X, y)
+
+
+def _resample(sampler_name: str, X, y, sampling_strategy, random_state,
+              use_cache: bool = True, **params) -> Tuple:
+    """Resample through the cache unless disabled or results are meant to be non-deterministic."""
+    global _memory
+    if random_state is None or not use_cache:
+        return _fit_resample(sampler_name, X, y, sampling_strategy, random_state, **params)
+    if _memory is None:
+        _memory = Memory(location=SAMPLING_CACHE_DIR, verbose=0)
+    return _memory.cache(_fit_resample)(sampler_name, X, y, sampling_strategy, random_state, **params)
+
 
 class NoSamplingStrategy(ISamplingStrategy):
     """Strategy that performs no resampling (pass-through)."""
     
+    __slots__ = ()
+    
     def resample(self, X, y) -> Tuple:
         """Return data unchanged.
         
@@ -30,6 +69,8 @@ class NoSamplingStrategy(ISamplingStrategy):
 class RandomOversamplingStrategy(ISamplingStrategy):
     """Strategy using random oversampling of minority class."""
     
+    __slots__ = ("sampling_strategy", "random_state")
+    
     def __init__(self, sampling_strategy: str = "minority", random_state: int = None):
         """
         Initialize random oversampler.
@@ -52,6 +93,8 @@ class RandomOversamplingStrategy(ISamplingStrategy):
         Returns:
             Tuple of (X_resampled, y_resampled)
         """
+        from imblearn.over_sampling import RandomOverSampler
+
         sampler = RandomOverSampler(
             sampling_strategy=self.sampling_strategy,
             random_state=self.random_state
@@ -62,20 +105,41 @@ class RandomOversamplingStrategy(ISamplingStrategy):
 class SMOTEStrategy(ISamplingStrategy):
     """Strategy using SMOTE (Synthetic Minority Over-sampling Technique)."""
     
-    def __init__(self, sampling_strategy: str = "minority", random_state: int = None):
+    __slots__ = ("sampling_strategy", "random_state", "categorical_features", "use_cache")
+    
+    def __init__(self, sampling_strategy: str = "minority", random_state: int = None,
+                 categorical_features: Optional[Sequence[int]] = None, use_cache: bool = True):
         """
         Initialize SMOTE sampler.
         
         Args:
             sampling_strategy: 'minority', 'all', or float ratio
             random_state: Random seed for reproducibility
+            categorical_features: Optional column indices of one-hot/boolean features
+                (e.g. ``Preprocessor.categorical_feature_indices_``). If given,
+                sparse input goes through SMOTE-NC so synthetic rows keep those
+                columns binary; this is far slower than SMOTE (see ``resample``)
+            use_cache: Cache results in ``SAMPLING_CACHE_DIR``; disable when the
+                caller caches the output itself (e.g. a Pipeline with ``memory``)
         """
         self.sampling_strategy = sampling_strategy
         self.random_state = random_state
+        self.categorical_features = categorical_features
+        self.use_cache = use_cache
     
     def resample(self, X, y) -> Tuple:
         """
         Apply SMOTE oversampling.
+
+        Sparse input is kept sparse (as CSR) end to end. When
+        ``categorical_features`` is set and leaves at least one continuous
+        column, sparse input is resampled with SMOTE-NC instead, which sets
+        those columns from the nearest neighbours rather than interpolating.
+        SMOTE-NC scales superlinearly (about 7s vs 0.4s for SMOTE on 8k rows of
+        the training data), so it is opt-in.
+
+        Results are cached on disk (see ``SAMPLING_CACHE_DIR``) when
+        ``random_state`` is set and ``use_cache`` is enabled.
         
         Args:
             X: Feature matrix
@@ -84,11 +148,13 @@ class SMOTEStrategy(ISamplingStrategy):
         Returns:
             Tuple of (X_resampled, y_resampled)
         """
-        sampler = SMOTE(
-            sampling_strategy=self.sampling_strategy,
-            random_state=self.random_state
-        )
-        return sampler.fit_resample(X, y)
+        if sparse.issparse(X):
+            X = X.tocsr()
+            cat_features = self.categorical_features
+            if cat_features is not None and 0 < len(cat_features) < X.shape[1]:
+                return _resample("SMOTENC", X, y, self.sampling_strategy, self.random_state,
+                                 use_cache=self.use_cache, categorical_features=list(cat_features))
+        return _resample("SMOTE", X, y, self.sampling_strategy, self.random_state, use_cache=self.use_cache)
 
 
 class ADASYNStrategy(ISamplingStrategy):
@@ -99,20 +165,28 @@ class ADASYNStrategy(ISamplingStrategy):
     for minority class examples that are harder to learn.
     """
     
-    def __init__(self, sampling_strategy: str = "minority", random_state: int = None):
+    __slots__ = ("sampling_strategy", "random_state", "use_cache")
+    
+    def __init__(self, sampling_strategy: str = "minority", random_state: int = None,
+                 use_cache: bool = True):
         """
         Initialize ADASYN sampler.
         
         Args:
             sampling_strategy: 'minority', 'all', or float ratio
             random_state: Random seed for reproducibility
+            use_cache: Cache results in ``SAMPLING_CACHE_DIR`` (see ``SMOTEStrategy``)
         """
         self.sampling_strategy = sampling_strategy
         self.random_state = random_state
+        self.use_cache = use_cache
     
     def resample(self, X, y) -> Tuple:
         """
         Apply ADASYN oversampling.
+
+        Results are cached on disk (see ``SAMPLING_CACHE_DIR``) when
+        ``random_state`` is set and ``use_cache`` is enabled.
         
         Args:
             X: Feature matrix
@@ -121,11 +195,7 @@ class ADASYNStrategy(ISamplingStrategy):
         Returns:
             Tuple of (X_resampled, y_resampled)
         """
-        sampler = ADASYN(
-            sampling_strategy=self.sampling_strategy,
-            random_state=self.random_state
-        )
-        return sampler.fit_resample(X, y)
+        return _resample("ADASYN", X, y, self.sampling_strategy, self.random_state, use_cache=self.use_cache)
 
 
 class SamplingStrategyFactory:
@@ -140,7 +210,8 @@ class SamplingStrategyFactory:
     
     @classmethod
     def create_strategy(cls, method: str, sampling_strategy: str = "minority",
-                       random_state: int = None) -> ISamplingStrategy:
+                       random_state: int = None, passthrough: bool = False,
+                       **strategy_params) -> ISamplingStrategy:
         """
         Create a sampling strategy instance.
         
@@ -148,9 +219,13 @@ class SamplingStrategyFactory:
             method: Sampling method name ("none", "random", "smote", "adasyn")
             sampling_strategy: How to balance ('minority', 'all', or float)
             random_state: Random seed for reproducibility
+            passthrough: If True, return the Pipeline marker ``"passthrough"``
+                         for "none" instead of a NoSamplingStrategy instance
+            **strategy_params: Extra strategy constructor arguments
+                               (e.g. ``categorical_features`` for "smote")
             
         Returns:
-            ISamplingStrategy instance
+            ISamplingStrategy instance, or "passthrough"
             
         Raises:
             ValueError: if method not found in registry
@@ -168,11 +243,12 @@ class SamplingStrategyFactory:
         
         # NoSamplingStrategy doesn't take parameters
         if method == "none":
-            return strategy_class()
+            return "passthrough" if passthrough else strategy_class()
         
         return strategy_class(
             sampling_strategy=sampling_strategy,
-            random_state=random_state
+            random_state=random_state,
+            **strategy_params
         )
     
     @classmethod
@@ -16,6 +16,8 @@ class NoScaler:
     Useful for cases where scaling is disabled via configuration.
     """
     
+    __slots__ = ()
+    
     def fit(self, X, y=None):
         """
         No-op fit method.
@@ -74,15 +76,17 @@ class ScalerFactory:
     }
     
     @classmethod
-    def create_scaler(cls, scaler_type: str = "standard"):
+    def create_scaler(cls, scaler_type: str = "standard", passthrough: bool = False):
         """
         Create a scaler instance from type.
         
         Args:
             scaler_type: Type of scaler ("none", "standard", "minmax", "robust")
+            passthrough: If True, return the sklearn Pipeline marker ``"passthrough"``
+                         for "none" instead of a NoScaler instance
             
         Returns:
-            Scaler instance with fit() and transform() methods
+            Scaler instance with fit() and transform() methods, or "passthrough"
             
         Raises:
             ValueError: if scaler_type not found in registry
@@ -96,6 +100,9 @@ class ScalerFactory:
                 f"Available scalers: {available}"
             )
         
+        if passthrough and scaler_type == "none":
+            return "passthrough"
+        
         scaler_class = cls._scaler_registry[scaler_type]
         return scaler_class()
     
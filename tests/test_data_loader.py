@@ -2,8 +2,14 @@ import unittest
 import os
 import tempfile
 from unittest.mock import patch, MagicMock
+import numpy as np
 import pandas as pd
 from src.data_loader import CSVLoader
+from src.config import AppConfig, FeatureConfig
+from src.preprocessor import Preprocessor
+
+TRAIN_CSV = os.path.join(os.path.dirname(__file__), '..', 'data', 'train_data.csv')
+
 
 class TestCSVLoader(unittest.TestCase):
     @patch('pandas.read_csv')
@@ -43,3 +49,74 @@ class TestCSVLoader(unittest.TestCase):
         # Assert
         with self.assertRaises(FileNotFoundError):
             loader.load()
+
+    def test_load_chunked_with_config_dtypes(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_data.csv")
+            pd.DataFrame({
+                'is_esc': ['Yes', 'No', 'Yes'],
+                'length': ['3445', 'bad', '4300'],
+                'make': ['1', '2', '3'],
+            }).to_csv(file_path, index=False)
+
+            loader = CSVLoader(file_path, FeatureConfig())
+            df_loaded = loader.load(chunksize=2)
+
+            self.assertEqual(len(df_loaded), 3)
+            # Non-numeric floats are left for the preprocessor to coerce to NaN
+            lengths = pd.to_numeric(df_loaded['length'], errors='coerce')
+            self.assertEqual(lengths.isna().tolist(), [False, True, False])
+            self.assertEqual(list(df_loaded['is_esc'].cat.categories), ['Yes', 'No'])
+            self.assertIsInstance(df_loaded['make'].dtype, pd.CategoricalDtype)
+            self.assertEqual(sorted(df_loaded['make'].cat.categories), [1, 2, 3])
+
+    def test_load_int_categories_keep_numeric_labels(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_data.csv")
+            pd.DataFrame({'displacement': [1196, 796, 998]}).to_csv(file_path, index=False)
+
+            df_loaded = CSVLoader(file_path, FeatureConfig()).load()
+
+            self.assertEqual(sorted(df_loaded['displacement'].cat.categories), [796, 998, 1196])
+
+    @unittest.skipUnless(os.path.exists(TRAIN_CSV), "training data not available")
+    def test_typed_and_untyped_loads_encode_identically(self):
+        app_config = AppConfig()
+        untyped = CSVLoader(TRAIN_CSV).load()
+        reference = Preprocessor(app_config).fit(untyped)
+        X_expected = reference.transform(untyped)
+
+        loader = CSVLoader(TRAIN_CSV, app_config.features)
+        for typed in (loader.load(), loader.load(chunksize=20_000)):
+            preprocessor = Preprocessor(app_config).fit(typed)
+            np.testing.assert_array_equal(preprocessor.get_feature_names_out(), reference.get_feature_names_out())
+            pd.testing.assert_frame_equal(preprocessor.transform(typed), X_expected)
+            pd.testing.assert_frame_equal(reference.transform(typed), X_expected)
+
+    @unittest.skipUnless(os.path.exists(TRAIN_CSV), "training data not available")
+    def test_pyarrow_engine_matches_c_engine(self):
+        read_csv = pd.read_csv
+
+        def pyarrow_read_csv(path, dtype=None, engine=None, **kwargs):
+            # pandas' pyarrow engine infers column types first, then applies ``dtype`` via astype
+            self.assertEqual(engine, "pyarrow")
+            return read_csv(path, **kwargs).astype(dtype)
+
+        loader = CSVLoader(TRAIN_CSV, FeatureConfig())
+        expected = loader.load(chunksize=20_000)
+        with patch('src.data_loader._pyarrow_available', return_value=True), \
+                patch('pandas.read_csv', side_effect=pyarrow_read_csv):
+            df_loaded = loader.load()
+
+        pd.testing.assert_frame_equal(df_loaded, expected, check_categorical=False)
+        for col in loader.default_dtypes():
+            self.assertEqual(sorted(df_loaded[col].cat.categories), sorted(expected[col].cat.categories))
+
+    def test_iter_chunks_streams_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            file_path = os.path.join(tmpdir, "test_data.csv")
+            pd.DataFrame({'col1': range(5)}).to_csv(file_path, index=False)
+
+            chunks = list(CSVLoader(file_path).iter_chunks(chunksize=2))
+
+            self.assertEqual([len(c) for c in chunks], [2, 2, 1])
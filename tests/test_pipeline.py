@@ -1,12 +1,15 @@
 import unittest
-from unittest.mock import MagicMock
+import tempfile
+from unittest.mock import MagicMock, patch
 import pandas as pd
 import numpy as np
+from sklearn.linear_model import LogisticRegression
 
 from src.config import AppConfig, PipelineConfig
-from src.pipeline import PipelineOrchestrator
+from src.pipeline import PipelineOrchestrator, build_pipeline
 from src.model_factory import ModelFactory
 from src.preprocessor import Preprocessor
+from src.sampling_strategy import _fit_resample
 
 class TestPipeline(unittest.TestCase):
     def setUp(self):
@@ -58,4 +61,79 @@ class TestPipeline(unittest.TestCase):
             
         accuracy = results.loc["Logistic Regression", "Accuracy"]
         self.assertGreaterEqual(accuracy, 0.0)
-        self.assertLessEqual(accuracy, 1.0)
\ No newline at end of file
+        self.assertLessEqual(accuracy, 1.0)
+
+    def test_sparse_output_with_centering_scaler_raises(self):
+        self.config.pipeline.sparse_output = True
+        orchestrator = PipelineOrchestrator(self.config, self.mock_loader, self.preprocessor)
+
+        with self.assertRaisesRegex(ValueError, "scaler_type='standard'"):
+            orchestrator.run()
+        self.mock_loader.load.assert_not_called()
+
+    @patch('src.pipeline.SamplingStrategyFactory.create_strategy')
+    def test_sparse_smote_uses_smote_nc_only_when_enabled(self, mock_create_strategy):
+        mock_create_strategy.return_value.resample.side_effect = lambda X, y: (X, y)
+        self.config.pipeline.sparse_output = True
+        self.config.pipeline.scaler_type = "none"
+        self.config.pipeline.oversampling_method = "smote"
+
+        for smote_nc in (False, True):
+            self.config.pipeline.smote_nc = smote_nc
+            orchestrator = PipelineOrchestrator(self.config, self.mock_loader, Preprocessor(self.config))
+            orchestrator.add_model("Logistic Regression", ModelFactory.create_model("logistic_regression", {}))
+            orchestrator.run()
+
+            kwargs = mock_create_strategy.call_args.kwargs
+            self.assertEqual("categorical_features" in kwargs, smote_nc)
+
+
+class TestBuildPipeline(unittest.TestCase):
+    def setUp(self):
+        self.raw_data = pd.DataFrame({
+            'policy_id': [f'ID{i}' for i in range(8)],
+            'is_parking_camera': ['Yes', 'No'] * 4,
+            'length': ['4000', '4200', '4100', '4300', '3900', '4050', '4150', '4250'],
+            'transmission_type': ['Manual', 'Automatic', 'Manual', 'Manual'] * 2,
+        })
+        self.y = pd.Series([1, 0, 0, 0, 1, 0, 0, 0])
+        self.config = AppConfig(random_state=42)
+
+    def test_build_pipeline_fits_raw_data_with_cache(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            pipe = build_pipeline(self.config, "random", "standard", LogisticRegression(), cache_dir=tmpdir)
+            pipe.fit(self.raw_data, self.y)
+            preds = pipe.predict(self.raw_data)
+
+            self.assertEqual(list(pipe.named_steps), ['pre', 'sampler', 'model'])
+            self.assertEqual(len(preds), len(self.raw_data))
+
+    def test_build_pipeline_reuses_cached_sampler_output(self):
+        raw_data = pd.concat([self.raw_data] * 4, ignore_index=True)
+        # y shares the raw frame's index object, as it does when popped from the loaded frame
+        y = pd.Series([1, 0, 0, 0] * 8, index=raw_data.index)
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                patch('src.sampling_strategy._fit_resample', wraps=_fit_resample) as mock_fit_resample:
+            for C in (1.0, 0.1):
+                pipe = build_pipeline(self.config, "smote", "standard", LogisticRegression(), cache_dir=tmpdir)
+                pipe.set_params(model__clf__C=C).fit(raw_data, y)
+
+        self.assertEqual(mock_fit_resample.call_count, 1)
+
+    @patch('src.sampling_strategy._memory')
+    def test_build_pipeline_caches_sampler_only_under_cache_dir(self, mock_memory):
+        raw_data = pd.concat([self.raw_data] * 4, ignore_index=True)
+        y = pd.Series([1, 0, 0, 0] * 8)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for cache_dir in (tmpdir, None):
+                pipe = build_pipeline(self.config, "smote", "standard", LogisticRegression(), cache_dir=cache_dir)
+                pipe.fit(raw_data, y)
+
+        mock_memory.cache.assert_not_called()
+
+    def test_build_pipeline_none_steps_are_passthrough(self):
+        pipe = build_pipeline(self.config, "none", "none", LogisticRegression(), cache_dir=None)
+        pipe.fit(self.raw_data, self.y)
+
+        self.assertEqual(pipe.named_steps['sampler'], 'passthrough')
+        self.assertEqual(pipe.named_steps['model'].named_steps['scaler'], 'passthrough')
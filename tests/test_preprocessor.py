@@ -1,6 +1,9 @@
 import unittest
 import pandas as pd
 import numpy as np
+from scipy import sparse
+from sklearn.exceptions import NotFittedError
+from sklearn.utils.validation import check_is_fitted
 from src.preprocessor import Preprocessor
 from src.config import AppConfig, FeatureConfig
 
@@ -33,10 +36,11 @@ class TestPreprocessor(unittest.TestCase):
         self.assertNotIn('policy_id', X.columns)
         self.assertTrue(X['is_parking_camera'].iloc[0])  
         self.assertFalse(X['is_parking_camera'].iloc[1]) 
-        self.assertEqual(X['length'].dtype, float)
+        self.assertEqual(X['length'].dtype, np.float32)
         self.assertNotIn('transmission_type', X.columns)
         self.assertEqual(len(y), 2)
         self.assertTrue(isinstance(y, pd.Series))
+        self.assertEqual(y.dtype, np.int8)
 
     def test_process_handles_missing_ncap_rating_gracefully(self):
         raw_data = pd.DataFrame({
@@ -53,4 +57,127 @@ class TestPreprocessor(unittest.TestCase):
     def test_process_raises_when_target_missing(self):
         bad_data = self.raw_data.drop(columns=['is_claim'])
         with self.assertRaises(ValueError):
-            self.processor.process(bad_data)
\ No newline at end of file
+            self.processor.process(bad_data)
+
+    def test_process_sparse_output(self):
+        self.app_config.pipeline.sparse_output = True
+        X, y = self.processor.process(self.raw_data)
+
+        self.assertTrue(sparse.isspmatrix_csr(X))
+        self.assertEqual(X.dtype, np.float32)
+        names = self.processor.get_feature_names_out().tolist()
+        self.assertEqual(X.shape, (2, len(names)))
+        self.assertIn('transmission_type_Manual', names)
+        self.assertEqual(X[0, names.index('transmission_type_Manual')], 1.0)
+        self.assertEqual(X[1, names.index('transmission_type_Manual')], 0.0)
+
+    def test_categorical_feature_indices(self):
+        self.processor.process(self.raw_data)
+        names = self.processor.get_feature_names_out()
+
+        picked = [names[i] for i in self.processor.categorical_feature_indices_]
+        self.assertEqual(picked, ['is_parking_camera', 'transmission_type_Manual'])
+
+    def test_transform_reuses_fitted_layout(self):
+        train, test = self.raw_data, pd.DataFrame({
+            'policy_id': ['789'],
+            'is_parking_camera': ['Yes'],
+            'length': ['4100'],
+            'ncap_rating': ['9'],
+            'transmission_type': ['CVT']
+        })
+        self.processor.fit(train)
+        X_test = self.processor.transform(test)
+
+        self.assertEqual(list(X_test.columns), self.processor.get_feature_names_out().tolist())
+        self.assertEqual(X_test['ncap_rating'].iloc[0], -1)
+        self.assertEqual(X_test['transmission_type_Manual'].iloc[0], 0)
+
+    def test_transform_fills_missing_columns_with_zero(self):
+        self.processor.fit(self.raw_data)
+        X = self.processor.transform(self.raw_data.drop(columns=['length', 'transmission_type']))
+
+        self.assertEqual(list(X.columns), self.processor.get_feature_names_out().tolist())
+        self.assertTrue((X['length'] == 0).all())
+        self.assertTrue((X['transmission_type_Manual'] == 0).all())
+        self.assertEqual(X['is_parking_camera'].tolist(), [1.0, 0.0])
+
+    def test_sklearn_fitted_state_and_params(self):
+        processor = Preprocessor(self.app_config)
+        with self.assertRaises(NotFittedError):
+            check_is_fitted(processor)
+        check_is_fitted(processor.fit(self.raw_data))
+
+        # set_params swaps the whole config, including the feature layout
+        features = FeatureConfig(
+            id_columns=['policy_id'],
+            boolean_columns=['is_parking_camera'],
+            float_columns=['length'],
+            ordinal_columns={},
+            categorical_columns=['ncap_rating', 'transmission_type']
+        )
+        processor.set_params(app_config=AppConfig(target_column='is_claim', features=features))
+        X = processor.fit(self.raw_data).transform(self.raw_data)
+        self.assertIn('ncap_rating_5', X.columns)
+        self.assertNotIn('ncap_rating', X.columns)
+
+    def test_unconfigured_columns_pass_through_as_float32(self):
+        X, _ = self.processor.process(self.raw_data.assign(policy_tenure=[0.5, 1.25]))
+
+        self.assertEqual(X['policy_tenure'].dtype, np.float32)
+        self.assertEqual(X['policy_tenure'].tolist(), [0.5, 1.25])
+
+        with self.assertRaisesRegex(ValueError, "'area_note'"):
+            self.processor.process(self.raw_data.assign(area_note=['north', 'south']))
+
+    def test_transform_before_fit_raises(self):
+        with self.assertRaises(ValueError):
+            Preprocessor(self.app_config).transform(self.raw_data)
+
+    def test_process_does_not_mutate_input(self):
+        original = self.raw_data.copy()
+        self.processor.process(self.raw_data)
+
+        pd.testing.assert_frame_equal(self.raw_data, original)
+
+    def test_process_categorical_input_matches_object_input(self):
+        typed = self.raw_data.astype({'ncap_rating': 'category', 'transmission_type': 'category'})
+
+        X_obj, _ = Preprocessor(self.app_config).process(self.raw_data)
+        X_cat, _ = Preprocessor(self.app_config).process(typed)
+
+        pd.testing.assert_frame_equal(X_cat, X_obj)
+
+    def test_transform_fitted_categorical_dtypes_match_object_input(self):
+        self.processor.fit(self.raw_data)
+        dtypes = self.processor.categorical_dtypes_
+        self.assertEqual(list(dtypes), ['transmission_type'])
+
+        typed = self.raw_data.astype(dtypes)
+        pd.testing.assert_frame_equal(self.processor.transform(typed), self.processor.transform(self.raw_data))
+
+    def test_partial_fit_matches_fit_on_full_data(self):
+        full = pd.DataFrame({
+            'policy_id': ['1', '2', '3', '4'],
+            'is_parking_camera': ['Yes', 'No', 'No', 'Yes'],
+            'is_claim': [1, 0, 0, 1],
+            'length': ['4000', '4200', '3800', 'bad'],
+            'ncap_rating': ['3', '5', '1', '2'],
+            'transmission_type': ['Manual', 'Manual', 'Automatic', 'CVT']
+        })
+        streamed = Preprocessor(self.app_config)
+        for chunk in (full.iloc[:2], full.iloc[2:]):
+            streamed.partial_fit(chunk)
+        batch = Preprocessor(self.app_config).fit(full)
+
+        np.testing.assert_array_equal(streamed.get_feature_names_out(), batch.get_feature_names_out())
+        self.assertAlmostEqual(streamed.float_mean_['length'], 4000.0)
+        self.assertAlmostEqual(streamed.float_var_['length'], np.var([4000, 4200, 3800]))
+        # Plain fit does not pay for the running statistics
+        self.assertTrue(batch.float_mean_.isna().all())
+
+        blocks = list(streamed.transform_chunks([full.iloc[:3], full.iloc[3:].drop(columns=['is_claim'])]))
+        self.assertEqual([len(X) for X, _ in blocks], [3, 1])
+        self.assertEqual(blocks[0][1].tolist(), [1, 0, 0])
+        self.assertIsNone(blocks[1][1])
+        pd.testing.assert_frame_equal(pd.concat([X for X, _ in blocks]), batch.transform(full))
@@ -1,18 +1,37 @@
 import unittest
+import tempfile
 from unittest.mock import patch
 import numpy as np
+from joblib import Memory
+from scipy import sparse
 from src.sampling_strategy import (
     SamplingStrategyFactory, 
     NoSamplingStrategy, 
-    RandomOversamplingStrategy
+    RandomOversamplingStrategy,
+    SMOTEStrategy,
+    _fit_resample
 )
 
 class TestSamplingStrategyFactory(unittest.TestCase):
+    def setUp(self):
+        # Cache resampling results in a throwaway directory, not the real SAMPLING_CACHE_DIR
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.memory = Memory(tmpdir.name, verbose=0)
+        patcher = patch('src.sampling_strategy._memory', self.memory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
     def test_create_strategy_none(self):
         strategy = SamplingStrategyFactory.create_strategy("none")
         
         self.assertIsInstance(strategy, NoSamplingStrategy)
         
+    def test_create_strategy_none_passthrough(self):
+        strategy = SamplingStrategyFactory.create_strategy("none", passthrough=True)
+        
+        self.assertEqual(strategy, "passthrough")
+        
     def test_create_strategy_random(self):
         strategy = SamplingStrategyFactory.create_strategy(
             "random", 
@@ -23,6 +42,7 @@ class TestSamplingStrategyFactory(unittest.TestCase):
         self.assertIsInstance(strategy, RandomOversamplingStrategy)
         self.assertEqual(strategy.sampling_strategy, "all")
         self.assertEqual(strategy.random_state, 42)
+        self.assertFalse(hasattr(strategy, "__dict__"))
 
     def test_create_strategy_unknown_raises_error(self):
         with self.assertRaises(ValueError):
@@ -38,7 +58,7 @@ class TestSamplingStrategyFactory(unittest.TestCase):
         np.testing.assert_array_equal(X_res, X)
         np.testing.assert_array_equal(y_res, y)
 
-    @patch('src.sampling_strategy.RandomOverSampler')
+    @patch('imblearn.over_sampling.RandomOverSampler')
     def test_random_oversampling_resample(self, mock_ros_class):
         mock_instance = mock_ros_class.return_value
         mock_instance.fit_resample.return_value = ("mock_X", "mock_y")
@@ -51,4 +71,30 @@ class TestSamplingStrategyFactory(unittest.TestCase):
         mock_ros_class.assert_called_once_with(sampling_strategy="minority", random_state=42)
         mock_instance.fit_resample.assert_called_once_with(X, y)
         self.assertEqual(X_res, "mock_X")
-        self.assertEqual(y_res, "mock_y")
\ No newline at end of file
+        self.assertEqual(y_res, "mock_y")
+
+    def test_smote_resample_is_cached(self):
+        rng = np.random.RandomState(0)
+        X = rng.rand(30, 2)
+        y = np.array([0] * 22 + [1] * 8)
+        strategy = SMOTEStrategy(sampling_strategy="minority", random_state=42)
+
+        X_res, y_res = strategy.resample(X, y)
+
+        self.assertEqual(np.bincount(y_res).tolist(), [22, 22])
+        cached = self.memory.cache(_fit_resample)
+        self.assertTrue(cached.check_call_in_cache("SMOTE", X, y, "minority", 42))
+        X_again, _ = strategy.resample(X, y)
+        np.testing.assert_array_equal(X_again, X_res)
+
+    def test_smote_sparse_keeps_categorical_columns_binary(self):
+        rng = np.random.RandomState(0)
+        X = np.column_stack([rng.rand(30), rng.randint(0, 2, size=(30, 2))])
+        y = np.array([0] * 22 + [1] * 8)
+        strategy = SMOTEStrategy(random_state=42, categorical_features=[1, 2])
+
+        X_res, y_res = strategy.resample(sparse.csr_matrix(X), y)
+
+        self.assertTrue(sparse.issparse(X_res))
+        self.assertEqual(np.bincount(y_res).tolist(), [22, 22])
+        self.assertTrue(np.isin(X_res[:, 1:].toarray(), [0, 1]).all())
@@ -4,6 +4,7 @@ import tempfile
 import os
 import sys
 import importlib
+from joblib import Memory
 
 from src.visualizer import MatplotlibVisualizer
 original_viz_init = MatplotlibVisualizer.__init__
@@ -20,6 +21,7 @@ class TestEndToEnd(unittest.TestCase):
                 original_viz_init(self, output_dir=tmpdir)
 
             with patch('src.config.AppConfig.data_path', 'data/truncated_train_data.csv'), \
+                 patch('src.sampling_strategy._memory', Memory(os.path.join(tmpdir, 'sampling'), verbose=0)), \
                  patch.object(MatplotlibVisualizer, '__init__', mocked_viz_init), \
                  patch('sys.argv', ['main.py']):
                 
@@ -9,6 +9,11 @@ class TestScalerFactory(unittest.TestCase):
         
         self.assertIsInstance(scaler, StandardScaler)
             
+    def test_create_scaler_none_passthrough(self):
+        self.assertEqual(ScalerFactory.create_scaler("none", passthrough=True), "passthrough")
+        self.assertIsInstance(ScalerFactory.create_scaler("none"), NoScaler)
+        self.assertIsInstance(ScalerFactory.create_scaler("standard", passthrough=True), StandardScaler)
+            
     def test_create_scaler_unknown_raises_error(self):
         with self.assertRaises(ValueError):
             ScalerFactory.create_scaler("unknown_scaler")